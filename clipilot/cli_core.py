@@ -2,19 +2,42 @@
 Core CLI functionality for Copilot Chat without VSCode.
 """
 
-import json
+import logging
 import os
+import stat
 import sys
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import List, Optional, Dict, Any
-import subprocess
-import tempfile
 
 from .config import CLIConfig
-from .context_manager import WorkspaceContextManager
-from .chat_interface import ChatInterface
-from .interactive_session import InteractiveSession
-from .github_auth import GitHubAuth, perform_github_login, verify_github_token
+
+# Upper bound on threads used to read context files concurrently
+_MAX_READ_WORKERS = 8
+
+# Seconds a successful token verification is trusted before re-checking
+_TOKEN_VERIFY_TTL = 600
+
+logger = logging.getLogger(__name__)
+
+
+def _enable_verbose_logging():
+    """Send this module's debug messages to stdout as plain lines."""
+    if not logger.handlers:
+        handler = logging.StreamHandler(sys.stdout)
+        handler.setFormatter(logging.Formatter("%(message)s"))
+        logger.addHandler(handler)
+        logger.propagate = False
+    logger.setLevel(logging.DEBUG)
+
+
+def _print_traceback():
+    """Print the traceback of the exception being handled.
+    
+    traceback is imported here so it is only loaded once an error is reported.
+    """
+    import traceback
+    traceback.print_exc()
 
 
 class CLIPilot:
@@ -28,14 +51,33 @@ class CLIPilot:
             verbose: Enable verbose logging
             config_path: Path to configuration file
         """
-        self.workspace = Path(workspace).resolve()
+        # abspath is string-only; resolve() would lstat every component to follow symlinks
+        self.workspace = Path(os.path.abspath(workspace))
         self.verbose = verbose
         self.config = CLIConfig(config_path)
-        self.context_manager = WorkspaceContextManager(self.workspace, verbose=verbose)
-        self.chat_interface = ChatInterface(self.config, verbose=verbose)
+        # Created on first use so auth commands don't pay for chat/workspace setup
+        self._context_manager = None
+        self._chat_interface = None
         
         if verbose:
-            print(f"Initialized CLI Pilot in workspace: {self.workspace}")
+            _enable_verbose_logging()
+        logger.debug("Initialized CLI Pilot in workspace: %s", self.workspace)
+    
+    @property
+    def context_manager(self):
+        """Workspace context manager, created on first access."""
+        if self._context_manager is None:
+            from .context_manager import WorkspaceContextManager
+            self._context_manager = WorkspaceContextManager(self.workspace, verbose=self.verbose)
+        return self._context_manager
+    
+    @property
+    def chat_interface(self):
+        """Chat interface, created on first access."""
+        if self._chat_interface is None:
+            from .chat_interface import ChatInterface
+            self._chat_interface = ChatInterface(self.config, verbose=self.verbose)
+        return self._chat_interface
     
     def handle_auth_login(self, client_id: Optional[str] = None) -> int:
         """Handle GitHub OAuth login.
@@ -49,6 +91,8 @@ class CLIPilot:
         try:
             print("Starting GitHub authentication...")
             
+            from .github_auth import GitHubAuth
+            
             # Create GitHub auth instance
             github_auth = GitHubAuth(client_id=client_id, verbose=self.verbose)
             
@@ -76,8 +120,7 @@ class CLIPilot:
         except Exception as e:
             print(f"Authentication error: {e}")
             if self.verbose:
-                import traceback
-                traceback.print_exc()
+                _print_traceback()
             return 1
     
     def handle_auth_status(self) -> int:
@@ -95,26 +138,26 @@ class CLIPilot:
             
             print("Checking authentication status...")
             
-            # Verify token is still valid
-            if verify_github_token(token, verbose=self.verbose):
-                # Get user info
-                github_auth = GitHubAuth(verbose=self.verbose)
-                user_info = github_auth.get_user_info(token)
+            from .github_auth import GitHubAuth
+            
+            # Fetching the user both verifies the token and gets the details
+            github_auth = GitHubAuth(verbose=self.verbose)
+            user_info = github_auth.get_user_info(token)
+            
+            if user_info:
+                self.config.mark_token_verified(token)
+                username = user_info.get("login", "Unknown")
+                name = user_info.get("name", username)
+                avatar_url = user_info.get("avatar_url", "")
                 
-                if user_info:
-                    username = user_info.get("login", "Unknown")
-                    name = user_info.get("name", username)
-                    avatar_url = user_info.get("avatar_url", "")
-                    
-                    print("✓ Authentication Status: Valid")
-                    print(f"  User: {name} ({username})")
-                    if avatar_url:
-                        print(f"  Profile: https://github.com/{username}")
-                else:
-                    print("✓ Authentication Status: Valid (unable to get user details)")
+                print("✓ Authentication Status: Valid")
+                print(f"  User: {name} ({username})")
+                if avatar_url:
+                    print(f"  Profile: https://github.com/{username}")
                 
                 return 0
             else:
+                self.config.clear_token_verification()
                 print("✗ Authentication Status: Invalid or expired")
                 print("Run 'python main.py auth login' to re-authenticate.")
                 return 1
@@ -122,8 +165,7 @@ class CLIPilot:
         except Exception as e:
             print(f"Error checking authentication status: {e}")
             if self.verbose:
-                import traceback
-                traceback.print_exc()
+                _print_traceback()
             return 1
     
     def handle_auth_logout(self) -> int:
@@ -148,8 +190,7 @@ class CLIPilot:
         except Exception as e:
             print(f"Error during logout: {e}")
             if self.verbose:
-                import traceback
-                traceback.print_exc()
+                _print_traceback()
             return 1
     
     def handle_chat(self, message: str, files: List[str] = None, 
@@ -170,8 +211,7 @@ class CLIPilot:
             if not self._check_authentication():
                 return 1
             
-            if self.verbose:
-                print(f"Processing chat message: {message[:50]}...")
+            logger.debug("Processing chat message: %.50s...", message)
             
             # Gather context
             context = self._gather_context(files, include_context)
@@ -191,8 +231,7 @@ class CLIPilot:
         except Exception as e:
             print(f"Error processing chat message: {e}")
             if self.verbose:
-                import traceback
-                traceback.print_exc()
+                _print_traceback()
             return 1
     
     def start_interactive(self, agent: Optional[str] = None) -> int:
@@ -209,6 +248,8 @@ class CLIPilot:
             if not self._check_authentication():
                 return 1
             
+            from .interactive_session import InteractiveSession
+            
             session = InteractiveSession(
                 chat_interface=self.chat_interface,
                 context_manager=self.context_manager,
@@ -220,8 +261,7 @@ class CLIPilot:
         except Exception as e:
             print(f"Error in interactive session: {e}")
             if self.verbose:
-                import traceback
-                traceback.print_exc()
+                _print_traceback()
             return 1
     
     def setup(self, token: Optional[str] = None) -> int:
@@ -244,6 +284,8 @@ class CLIPilot:
                 print("Error: Token is required")
                 return 1
             
+            from .github_auth import GitHubAuth, verify_github_token
+            
             # Verify token before saving
             if verify_github_token(token, verbose=self.verbose):
                 self.config.set_token(token)
@@ -265,8 +307,7 @@ class CLIPilot:
         except Exception as e:
             print(f"Error during setup: {e}")
             if self.verbose:
-                import traceback
-                traceback.print_exc()
+                _print_traceback()
             return 1
     
     def _check_authentication(self) -> bool:
@@ -282,12 +323,17 @@ class CLIPilot:
             print("  python main.py setup --token ... # Manual token setup")
             return False
         
-        # Verify token is still valid
+        # Verify token is still valid, unless it was verified recently
+        if self.config.is_token_recently_verified(token, _TOKEN_VERIFY_TTL):
+            return True
+        
+        from .github_auth import verify_github_token
         if not verify_github_token(token, verbose=self.verbose):
             print("Authentication token is invalid or expired.")
             print("Please re-authenticate with: python main.py auth login")
             return False
         
+        self.config.mark_token_verified(token)
         return True
     
     def _gather_context(self, files: Optional[List[str]] = None, 
@@ -307,38 +353,71 @@ class CLIPilot:
             "workspace_info": {}
         }
         
+        files = files or []
+        if not files and not include_workspace_context:
+            return context
+        
+        # Read the files and scan the workspace concurrently; results are
+        # still reported in order from this thread
+        max_size = self.config.get_workspace_config().get("max_file_size", 1024 * 1024)
+        workers = min(len(files) + include_workspace_context, _MAX_READ_WORKERS)
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            workspace_future = None
+            if include_workspace_context:
+                workspace_future = executor.submit(self.context_manager.get_workspace_context)
+            futures = [executor.submit(self._read_context_file, file_path, max_size)
+                       for file_path in files]
+        
         # Add specific files
-        if files:
-            for file_path in files:
-                try:
-                    full_path = self.workspace / file_path
-                    if full_path.exists() and full_path.is_file():
-                        with open(full_path, 'r', encoding='utf-8') as f:
-                            content = f.read()
-                        context["files"].append({
-                            "path": file_path,
-                            "content": content,
-                            "size": len(content)
-                        })
-                        if self.verbose:
-                            print(f"Added file to context: {file_path}")
-                    else:
-                        print(f"Warning: File not found: {file_path}")
-                except Exception as e:
-                    print(f"Warning: Could not read file {file_path}: {e}")
+        for file_path, future in zip(files, futures):
+            try:
+                context["files"].append(future.result())
+                logger.debug("Added file to context: %s", file_path)
+            except FileNotFoundError:
+                print(f"Warning: File not found: {file_path}")
+            except Exception as e:
+                print(f"Warning: Could not read file {file_path}: {e}")
         
         # Add workspace context if requested
-        if include_workspace_context:
+        if workspace_future is not None:
             try:
-                workspace_info = self.context_manager.get_workspace_context()
-                context["workspace_info"] = workspace_info
-                if self.verbose:
-                    print("Added workspace context")
+                context["workspace_info"] = workspace_future.result()
+                logger.debug("Added workspace context")
             except Exception as e:
                 print(f"Warning: Could not gather workspace context: {e}")
         
         return context
     
+    def _read_context_file(self, file_path: str, max_size: int) -> Dict[str, Any]:
+        """Read a single file to include as chat context.
+        
+        Args:
+            file_path: Path relative to the workspace
+            max_size: Largest file size in bytes that will be read
+            
+        Returns:
+            File context dictionary
+            
+        Raises:
+            FileNotFoundError: If the path is not an existing file
+            ValueError: If the file is larger than max_size
+        """
+        # Plain string paths; no Path object is needed just to stat and open
+        full_path = os.path.join(self.workspace, file_path)
+        # One stat call covers both the existence and regular-file checks
+        st = os.stat(full_path)
+        if not stat.S_ISREG(st.st_mode):
+            raise FileNotFoundError(file_path)
+        if st.st_size > max_size:
+            raise ValueError(f"file is {st.st_size} bytes, over the {max_size} byte limit")
+        with open(full_path, 'r', encoding='utf-8') as f:
+            content = f.read()
+        return {
+            "path": file_path,
+            "content": content,
+            "size": len(content)
+        }
+    
     def _display_response(self, response: Dict[str, Any]):
         """Display the chat response.
         
@@ -349,34 +428,18 @@ class CLIPilot:
             print(f"Error: {response['error']}")
             return
         
+        # Assemble the whole response and emit it with a single write
+        parts = []
         if "content" in response:
-            print("\n" + "="*60)
-            print("Copilot Response:")
-            print("="*60)
-            print(response["content"])
-            print("="*60 + "\n")
+            rule = "=" * 60
+            parts.append(f"\n{rule}\nCopilot Response:\n{rule}\n{response['content']}\n{rule}\n\n")
         
-        if "references" in response and response["references"]:
-            print("References:")
-            for ref in response["references"]:
-                print(f"  - {ref}")
-            print()
-    
-    def _test_configuration(self) -> bool:
-        """Test the current configuration.
+        references = response.get("references")
+        if references:
+            parts.append("References:\n")
+            parts.extend(f"  - {ref}\n" for ref in references)
+            parts.append("\n")
         
-        Returns:
-            True if configuration is valid, False otherwise
-        """
-        try:
-            # Simple test message
-            test_response = self.chat_interface.send_message(
-                message="Hello, this is a test message.",
-                context={},
-                agent=None
-            )
-            return "error" not in test_response
-        except Exception as e:
-            if self.verbose:
-                print(f"Configuration test failed: {e}")
-            return False
\ No newline at end of file
+        if parts:
+            sys.stdout.write("".join(parts))
+            sys.stdout.flush()
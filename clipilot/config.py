@@ -2,18 +2,114 @@
 Configuration management for CLI Pilot.
 """
 
+import copy
+import hashlib
 import json
+import logging
 import os
+import tempfile
+from contextlib import contextmanager
+from functools import lru_cache
 from pathlib import Path
-from typing import Optional, Dict, Any
+from typing import Iterator, Optional, Dict, Any, Tuple
 import time
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def _json_dumps(data: Any) -> bytes:
+    """Serialize data to indented JSON bytes, using orjson when available."""
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2)
+    return json.dumps(data, indent=2).encode('utf-8')
+
+
+def _json_loads(data: bytes) -> Any:
+    """Parse JSON bytes, using orjson when available."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+logger = logging.getLogger(__name__)
+
+# Built-in defaults; the config file only stores values that differ. Never mutated.
+_DEFAULT_CONFIG = {
+    "version": "1.0.0",
+    "auth": {
+        "token": None,
+        "token_type": "github_copilot"
+    },
+    "chat": {
+        "default_agent": "workspace",
+        "max_context_size": 4096,
+        "temperature": 0.1,
+        "history_limit": 1000
+    },
+    "workspace": {
+        "include_patterns": ["*.py", "*.js", "*.ts", "*.java", "*.cpp", "*.c", "*.h"],
+        "exclude_patterns": ["node_modules/**", ".git/**", "__pycache__/**", "*.pyc"],
+        "max_file_size": 1024 * 1024  # 1MB
+    },
+    "ui": {
+        "color_output": True,
+        "show_typing_indicator": True
+    }
+}
+
+
+def _token_fingerprint(token: str) -> str:
+    """Short, non-reversible identifier for a token."""
+    return hashlib.sha256(token.encode('utf-8')).hexdigest()[:16]
+
+
+@lru_cache(maxsize=64)
+def _split_key(key: str) -> Tuple[str, ...]:
+    """Split a dotted configuration key into its segments."""
+    return tuple(key.split('.'))
+
+
+def _deep_merge(target: Dict[str, Any], source: Dict[str, Any]):
+    """Merge source into target in place, descending into nested dicts.
+    
+    Args:
+        target: Dictionary to update
+        source: Dictionary whose values take precedence
+    """
+    stack = [(target, source)]
+    while stack:
+        dst, src = stack.pop()
+        for key, value in src.items():
+            existing = dst.get(key)
+            if isinstance(value, dict) and isinstance(existing, dict):
+                stack.append((existing, value))
+            else:
+                dst[key] = value
+
+
+@lru_cache(maxsize=1)
+def _env_token() -> Optional[str]:
+    """Read the token from the environment once per process."""
+    return os.getenv('GITHUB_COPILOT_TOKEN')
+
+
+# Config directories already created (or found) in this process
+_ENSURED_DIRS = set()
+
+# Marks a key that is absent from both the user config and the defaults
+_MISSING = object()
+
 
 class CLIConfig:
     """Manages configuration for CLI Pilot."""
     
     DEFAULT_CONFIG_DIR = Path.home() / ".clipilot"
     DEFAULT_CONFIG_FILE = "config.json"
+    # Token verification stamp, kept apart so checking a token never rewrites config.json
+    VERIFY_STAMP_FILE = "token_verified.json"
     
     def __init__(self, config_path: Optional[str] = None):
         """Initialize configuration.
@@ -27,59 +123,73 @@ class CLIConfig:
             self.config_path = self.DEFAULT_CONFIG_DIR / self.DEFAULT_CONFIG_FILE
         
         self.config_dir = self.config_path.parent
-        self._config_data = {}
-        
-        self._ensure_config_dir()
-        self._load_config()
+        self.verify_stamp_path = self.config_dir / self.VERIFY_STAMP_FILE
+        # Loaded from disk on first access; see _config_data
+        self._overrides = None
+        # Resolved get() lookups by key, cleared whenever the overrides change
+        self._get_cache = {}
+        # Nesting depth of batch() blocks and whether a save is pending
+        self._batch_depth = 0
+        self._dirty = False
+    
+    @property
+    def _config_data(self) -> Dict[str, Any]:
+        """User overrides layered over _DEFAULT_CONFIG; only these are saved."""
+        if self._overrides is None:
+            self._load_config()
+        return self._overrides
+    
+    @_config_data.setter
+    def _config_data(self, value: Dict[str, Any]):
+        self._overrides = value
+        self._get_cache.clear()
     
     def _ensure_config_dir(self):
         """Ensure configuration directory exists."""
+        if self.config_dir in _ENSURED_DIRS:
+            return
         self.config_dir.mkdir(parents=True, exist_ok=True)
+        _ENSURED_DIRS.add(self.config_dir)
     
     def _load_config(self):
         """Load configuration from file."""
-        if self.config_path.exists():
-            try:
-                with open(self.config_path, 'r', encoding='utf-8') as f:
-                    self._config_data = json.load(f)
-            except (json.JSONDecodeError, IOError) as e:
-                print(f"Warning: Could not load config from {self.config_path}: {e}")
-                self._config_data = {}
-        else:
-            self._config_data = self._get_default_config()
+        try:
+            data = self.config_path.read_bytes()
+        except FileNotFoundError:
+            # First run: nothing to parse, everything comes from defaults.
+            self._config_data = {}
+            return
+        except IOError as e:
+            logger.warning("Warning: Could not load config from %s: %s", self.config_path, e)
+            self._config_data = {}
+            return
+        try:
+            self._config_data = _json_loads(data)
+        except json.JSONDecodeError as e:
+            logger.warning("Warning: Could not load config from %s: %s", self.config_path, e)
+            self._config_data = {}
     
     def _save_config(self):
-        """Save configuration to file."""
+        """Save configuration to file.
+        
+        The data is written to a temporary file in the same directory and
+        moved over the config file, so a crash never leaves it half-written.
+        """
+        data = _json_dumps(self._config_data)
+        tmp_path = None
         try:
-            with open(self.config_path, 'w', encoding='utf-8') as f:
-                json.dump(self._config_data, f, indent=2)
+            self._ensure_config_dir()
+            fd, tmp_path = tempfile.mkstemp(dir=str(self.config_dir), suffix='.tmp')
+            with os.fdopen(fd, 'wb') as f:
+                f.write(data)
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(tmp_path, self.config_path)
         except IOError as e:
+            if tmp_path and os.path.exists(tmp_path):
+                os.unlink(tmp_path)
             raise Exception(f"Could not save config to {self.config_path}: {e}")
     
-    def _get_default_config(self) -> Dict[str, Any]:
-        """Get default configuration."""
-        return {
-            "version": "1.0.0",
-            "auth": {
-                "token": None,
-                "token_type": "github_copilot"
-            },
-            "chat": {
-                "default_agent": "workspace",
-                "max_context_size": 4096,
-                "temperature": 0.1
-            },
-            "workspace": {
-                "include_patterns": ["*.py", "*.js", "*.ts", "*.java", "*.cpp", "*.c", "*.h"],
-                "exclude_patterns": ["node_modules/**", ".git/**", "__pycache__/**", "*.pyc"],
-                "max_file_size": 1024 * 1024  # 1MB
-            },
-            "ui": {
-                "color_output": True,
-                "show_typing_indicator": True
-            }
-        }
-    
     def get(self, key: str, default: Any = None) -> Any:
         """Get configuration value.
         
@@ -88,18 +198,54 @@ class CLIConfig:
             default: Default value if key not found
             
         Returns:
-            Configuration value or default
+            Configuration value or default. Sections come back as a plain dict
+            merged from the user config and the defaults; sections and lists
+            are copies, so changing them does not affect the configuration.
         """
-        keys = key.split('.')
-        value = self._config_data
+        try:
+            value = self._get_cache[key]
+        except KeyError:
+            value = self._get_cache[key] = self._lookup(key)
+        if value is _MISSING:
+            return default
+        # The cached value is shared and may reference the defaults or overrides
+        if isinstance(value, (dict, list)):
+            return copy.deepcopy(value)
+        return value
+    
+    def _lookup(self, key: str) -> Any:
+        """Resolve a dotted key against the user config, then the defaults.
         
-        for k in keys:
-            if isinstance(value, dict) and k in value:
-                value = value[k]
+        Args:
+            key: Configuration key in dot notation
+            
+        Returns:
+            The resolved value, or _MISSING if the key is not set anywhere
+        """
+        keys = _split_key(key)
+        sections = []
+        
+        # User overrides first, then the built-in defaults
+        for layer in (self._config_data, _DEFAULT_CONFIG):
+            value = layer
+            for k in keys:
+                if isinstance(value, dict) and k in value:
+                    value = value[k]
+                else:
+                    break
             else:
-                return default
+                if isinstance(value, dict):
+                    sections.append(value)
+                elif not sections:
+                    return value
         
-        return value
+        if not sections:
+            return _MISSING
+        # Only the base layer needs copying; get() copies the result on the way out
+        merged = copy.deepcopy(sections[-1])
+        for section in reversed(sections[:-1]):
+            _deep_merge(merged, section)
+        return merged
     
     def set(self, key: str, value: Any):
         """Set configuration value.
@@ -108,7 +254,12 @@ class CLIConfig:
             key: Configuration key (supports dot notation)
             value: Value to set
         """
-        keys = key.split('.')
+        # Nothing to write if the effective value is already the same
+        existing = self.get(key, _MISSING)
+        if type(existing) is type(value) and existing == value:
+            return
+        
+        keys = _split_key(key)
         config = self._config_data
         
         # Navigate to the parent of the target key
@@ -119,7 +270,26 @@ class CLIConfig:
         
         # Set the value
         config[keys[-1]] = value
-        self._save_config()
+        self._get_cache.clear()
+        if self._batch_depth:
+            self._dirty = True
+        else:
+            self._save_config()
+    
+    @contextmanager
+    def batch(self) -> Iterator[None]:
+        """Defer saving until the outermost batch block exits.
+        
+        Multiple set() calls inside the block result in a single write.
+        """
+        self._batch_depth += 1
+        try:
+            yield
+        finally:
+            self._batch_depth -= 1
+            if not self._batch_depth and self._dirty:
+                self._dirty = False
+                self._save_config()
     
     def get_token(self) -> Optional[str]:
         """Get authentication token.
@@ -128,7 +298,7 @@ class CLIConfig:
             Authentication token or None
         """
         # Try environment variable first
-        token = os.getenv('GITHUB_COPILOT_TOKEN')
+        token = _env_token()
         if token:
             return token
         
@@ -141,14 +311,68 @@ class CLIConfig:
         Args:
             token: Authentication token (or None to remove)
         """
+        # A verification stamp only ever vouches for the token it was made for
+        if token != self.get('auth.token'):
+            self.clear_token_verification()
+        
         if token is None:
             # Remove token
             self.set('auth.token', None)
         else:
-            self.set('auth.token', token)
-            # Also set the token type to indicate it's a GitHub token
-            self.set('auth.token_type', 'github')
-            self.set('auth.authenticated_at', time.time())
+            with self.batch():
+                self.set('auth.token', token)
+                # Also set the token type to indicate it's a GitHub token
+                self.set('auth.token_type', 'github')
+                self.set('auth.authenticated_at', time.time())
+    
+    def mark_token_verified(self, token: str):
+        """Record that a token was just verified with GitHub.
+        
+        The stamp is only a cache, so failing to write it (e.g. a read-only
+        config directory) is ignored; the token is simply verified again.
+        
+        Args:
+            token: The verified authentication token
+        """
+        data = _json_dumps({
+            'token': _token_fingerprint(token),
+            'verified_at': time.time()
+        })
+        try:
+            self._ensure_config_dir()
+            self.verify_stamp_path.write_bytes(data)
+        except OSError as e:
+            logger.debug("Could not record token verification in %s: %s", self.verify_stamp_path, e)
+    
+    def clear_token_verification(self):
+        """Forget any recorded token verification, e.g. after a rejection."""
+        try:
+            self.verify_stamp_path.unlink()
+        except OSError:
+            # Already gone, or not removable; a stale stamp still has to match the token
+            pass
+    
+    def is_token_recently_verified(self, token: str, max_age: float) -> bool:
+        """Check whether a token was verified within the last max_age seconds.
+        
+        Args:
+            token: Authentication token to check
+            max_age: Maximum age of the verification in seconds
+            
+        Returns:
+            True if the same token was verified recently, False otherwise
+        """
+        try:
+            stamp = _json_loads(self.verify_stamp_path.read_bytes())
+        except (OSError, ValueError):
+            # No stamp yet, unreadable, or half-written by a concurrent run
+            return False
+        if not isinstance(stamp, dict) or stamp.get('token') != _token_fingerprint(token):
+            return False
+        verified_at = stamp.get('verified_at')
+        if not isinstance(verified_at, (int, float)):
+            return False
+        return 0 <= time.time() - verified_at < max_age
     
     def get_auth_info(self) -> Dict[str, Any]:
         """Get authentication information.
@@ -156,11 +380,12 @@ class CLIConfig:
         Returns:
             Authentication info dictionary
         """
+        token = self.get_token()
         return {
-            'token': self.get_token(),
+            'token': token,
             'token_type': self.get('auth.token_type', 'github'),
             'authenticated_at': self.get('auth.authenticated_at'),
-            'is_authenticated': self.is_configured()
+            'is_authenticated': token is not None
         }
     
     def get_chat_config(self) -> Dict[str, Any]:
@@ -189,7 +414,7 @@ class CLIConfig:
     
     def reset(self):
         """Reset configuration to defaults."""
-        self._config_data = self._get_default_config()
+        self._config_data = {}
         self._save_config()
     
     def export_config(self, path: str):
@@ -198,9 +423,7 @@ class CLIConfig:
         Args:
             path: Path to export file
         """
-        export_path = Path(path)
-        with open(export_path, 'w', encoding='utf-8') as f:
-            json.dump(self._config_data, f, indent=2)
+        Path(path).write_bytes(_json_dumps(self._config_data))
     
     def import_config(self, path: str):
         """Import configuration from a file.
@@ -212,8 +435,8 @@ class CLIConfig:
         if not import_path.exists():
             raise FileNotFoundError(f"Config file not found: {path}")
         
-        with open(import_path, 'r', encoding='utf-8') as f:
-            imported_config = json.load(f)
+        imported_config = _json_loads(import_path.read_bytes())
         
-        self._config_data.update(imported_config)
+        _deep_merge(self._config_data, imported_config)
+        self._get_cache.clear()
         self._save_config()
\ No newline at end of file
@@ -3,11 +3,76 @@ Workspace context management for CLI Pilot.
 """
 
 import os
+import re
+import shutil
 import subprocess
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from itertools import islice
 from pathlib import Path
-from typing import Dict, List, Any, Optional
+from typing import Dict, List, Any, Optional, Tuple
 import fnmatch
-import mimetypes
+
+
+# Upper bound on concurrent file reads while collecting workspace files
+_MAX_READ_WORKERS = 8
+
+
+# File extension to language name, used by _detect_language
+_LANGUAGE_MAP = {
+    '.py': 'python',
+    '.js': 'javascript',
+    '.ts': 'typescript',
+    '.jsx': 'javascript',
+    '.tsx': 'typescript',
+    '.java': 'java',
+    '.cpp': 'cpp',
+    '.cc': 'cpp',
+    '.cxx': 'cpp',
+    '.c': 'c',
+    '.h': 'c',
+    '.hpp': 'cpp',
+    '.cs': 'csharp',
+    '.php': 'php',
+    '.rb': 'ruby',
+    '.go': 'go',
+    '.rs': 'rust',
+    '.swift': 'swift',
+    '.kt': 'kotlin',
+    '.scala': 'scala',
+    '.md': 'markdown',
+    '.json': 'json',
+    '.yaml': 'yaml',
+    '.yml': 'yaml',
+    '.xml': 'xml',
+    '.html': 'html',
+    '.css': 'css'
+}
+
+
+@lru_cache(maxsize=16)
+def _compile_patterns(patterns: Tuple[str, ...]) -> re.Pattern:
+    """Compile glob patterns into one regex with fnmatch.fnmatch semantics.
+    
+    Args:
+        patterns: Glob patterns
+        
+    Returns:
+        Regex to match against os.path.normcase()-d names
+    """
+    if not patterns:
+        return re.compile(r"(?!)")
+    return re.compile("|".join(fnmatch.translate(os.path.normcase(p)) for p in patterns))
+
+
+@lru_cache(maxsize=1)
+def _git_executable() -> Optional[str]:
+    """Locate git on PATH once per process.
+    
+    Returns:
+        Absolute path to git, or None if it is not installed
+    """
+    return shutil.which("git")
 
 
 class WorkspaceContextManager:
@@ -74,30 +139,39 @@ class WorkspaceContextManager:
         Returns:
             Directory structure as nested dictionary
         """
-        def build_tree(path: Path, current_depth: int = 0) -> Dict[str, Any]:
+        def build_tree(path: str, relative_dir: str, current_depth: int = 0) -> Dict[str, Any]:
             if current_depth >= max_depth:
                 return {"type": "directory", "truncated": True}
             
             tree = {"type": "directory", "children": {}}
             
             try:
-                for item in sorted(path.iterdir()):
-                    if self._should_exclude_path(item):
+                # scandir entries carry their file type, so most entries need no stat
+                with os.scandir(path) as it:
+                    entries = sorted(it, key=lambda entry: os.path.normcase(entry.name))
+                
+                for entry in entries:
+                    relative_path = os.path.join(relative_dir, entry.name)
+                    if self._is_excluded(relative_path, entry.name):
                         continue
                     
-                    if item.is_dir():
-                        tree["children"][item.name] = build_tree(item, current_depth + 1)
+                    if entry.is_dir():
+                        tree["children"][entry.name] = build_tree(entry.path, relative_path, current_depth + 1)
                     else:
-                        tree["children"][item.name] = {
+                        try:
+                            size = entry.stat().st_size
+                        except OSError:
+                            size = 0
+                        tree["children"][entry.name] = {
                             "type": "file",
-                            "size": item.stat().st_size if item.exists() else 0
+                            "size": size
                         }
             except (PermissionError, OSError):
                 tree["error"] = "Permission denied"
             
             return tree
         
-        return build_tree(self.workspace_path)
+        return build_tree(str(self.workspace_path), "")
     
     def _get_relevant_files(self, max_files: int = 50) -> List[Dict[str, Any]]:
         """Get relevant files from workspace.
@@ -109,43 +183,58 @@ class WorkspaceContextManager:
             List of file information dictionaries
         """
         files = []
+        candidates = self._find_files()
         
-        for file_path in self._find_files():
-            if len(files) >= max_files:
-                break
-            
-            try:
-                stat = file_path.stat()
-                if stat.st_size > self.max_file_size:
-                    continue
-                
-                # Try to read file content
-                content = None
-                try:
-                    with open(file_path, 'r', encoding='utf-8') as f:
-                        content = f.read()
-                except (UnicodeDecodeError, IOError):
-                    # Binary file or read error
-                    continue
-                
-                relative_path = file_path.relative_to(self.workspace_path)
-                files.append({
-                    "path": str(relative_path),
-                    "full_path": str(file_path),
-                    "size": stat.st_size,
-                    "content": content,
-                    "language": self._detect_language(file_path),
-                    "modified_time": stat.st_mtime
-                })
-                
-            except (OSError, ValueError):
-                continue
+        with ThreadPoolExecutor(max_workers=_MAX_READ_WORKERS) as executor:
+            # Read candidates in batches sized to the files still needed; map keeps
+            # walk order, so the same files are picked as reading one at a time would
+            while len(files) < max_files:
+                batch = list(islice(candidates, max_files - len(files)))
+                if not batch:
+                    break
+                files.extend(info for info in executor.map(self._read_file_info, batch) if info is not None)
         
         # Sort by relevance (modify time, then size)
         files.sort(key=lambda f: (-f["modified_time"], f["size"]))
         
         return files
     
+    def _read_file_info(self, file_path: Path) -> Optional[Dict[str, Any]]:
+        """Read one candidate file for the workspace context.
+        
+        Args:
+            file_path: Path to file
+            
+        Returns:
+            File information dictionary, or None if the file is too large,
+            binary or unreadable
+        """
+        try:
+            stat = file_path.stat()
+            if stat.st_size > self.max_file_size:
+                return None
+            
+            # Try to read file content
+            try:
+                with open(file_path, 'r', encoding='utf-8') as f:
+                    content = f.read()
+            except (UnicodeDecodeError, IOError):
+                # Binary file or read error
+                return None
+            
+            relative_path = file_path.relative_to(self.workspace_path)
+            return {
+                "path": str(relative_path),
+                "full_path": str(file_path),
+                "size": stat.st_size,
+                "content": content,
+                "language": self._detect_language(file_path),
+                "modified_time": stat.st_mtime
+            }
+            
+        except (OSError, ValueError):
+            return None
+    
     def _find_files(self):
         """Find files matching include patterns and not matching exclude patterns."""
         for root, dirs, files in os.walk(self.workspace_path):
@@ -172,11 +261,8 @@ class WorkspaceContextManager:
         
         # Check include patterns
         relative_path = file_path.relative_to(self.workspace_path)
-        for pattern in self.include_patterns:
-            if fnmatch.fnmatch(file_path.name, pattern):
-                return True
-        
-        return False
+        include_re = _compile_patterns(tuple(self.include_patterns))
+        return include_re.match(os.path.normcase(file_path.name)) is not None
     
     def _should_exclude_path(self, path: Path) -> bool:
         """Check if path should be excluded.
@@ -192,13 +278,21 @@ class WorkspaceContextManager:
         except ValueError:
             return True
         
-        path_str = str(relative_path)
-        
-        for pattern in self.exclude_patterns:
-            if fnmatch.fnmatch(path_str, pattern) or fnmatch.fnmatch(path.name, pattern):
-                return True
+        return self._is_excluded(str(relative_path), path.name)
+    
+    def _is_excluded(self, relative_path: str, name: str) -> bool:
+        """Check a workspace-relative path and its final component against exclude patterns.
         
-        return False
+        Args:
+            relative_path: Path relative to the workspace root
+            name: Final component of the path
+            
+        Returns:
+            True if path should be excluded
+        """
+        exclude_re = _compile_patterns(tuple(self.exclude_patterns))
+        return (exclude_re.match(os.path.normcase(relative_path)) is not None
+                or exclude_re.match(os.path.normcase(name)) is not None)
     
     def _detect_language(self, file_path: Path) -> Optional[str]:
         """Detect programming language from file extension.
@@ -210,38 +304,7 @@ class WorkspaceContextManager:
             Language name or None
         """
         suffix = file_path.suffix.lower()
-        
-        language_map = {
-            '.py': 'python',
-            '.js': 'javascript',
-            '.ts': 'typescript',
-            '.jsx': 'javascript',
-            '.tsx': 'typescript',
-            '.java': 'java',
-            '.cpp': 'cpp',
-            '.cc': 'cpp',
-            '.cxx': 'cpp',
-            '.c': 'c',
-            '.h': 'c',
-            '.hpp': 'cpp',
-            '.cs': 'csharp',
-            '.php': 'php',
-            '.rb': 'ruby',
-            '.go': 'go',
-            '.rs': 'rust',
-            '.swift': 'swift',
-            '.kt': 'kotlin',
-            '.scala': 'scala',
-            '.md': 'markdown',
-            '.json': 'json',
-            '.yaml': 'yaml',
-            '.yml': 'yaml',
-            '.xml': 'xml',
-            '.html': 'html',
-            '.css': 'css'
-        }
-        
-        return language_map.get(suffix)
+        return _LANGUAGE_MAP.get(suffix)
     
     def _get_git_info(self) -> Dict[str, Any]:
         """Get Git repository information.
@@ -251,57 +314,54 @@ class WorkspaceContextManager:
         """
         git_info = {"available": False}
         
+        # Without git on PATH there is nothing to spawn
+        if _git_executable() is None:
+            return git_info
+        
         try:
             # Check if this is a git repository
-            result = subprocess.run(
-                ["git", "rev-parse", "--git-dir"],
-                cwd=self.workspace_path,
-                capture_output=True,
-                text=True,
-                timeout=5
-            )
+            if self._run_git("rev-parse", "--git-dir") is None:
+                return git_info
+            git_info["available"] = True
             
-            if result.returncode == 0:
-                git_info["available"] = True
-                
-                # Get current branch
-                result = subprocess.run(
-                    ["git", "branch", "--show-current"],
-                    cwd=self.workspace_path,
-                    capture_output=True,
-                    text=True,
-                    timeout=5
-                )
-                if result.returncode == 0:
-                    git_info["branch"] = result.stdout.strip()
-                
-                # Get remote URL
-                result = subprocess.run(
-                    ["git", "remote", "get-url", "origin"],
-                    cwd=self.workspace_path,
-                    capture_output=True,
-                    text=True,
-                    timeout=5
-                )
-                if result.returncode == 0:
-                    git_info["remote"] = result.stdout.strip()
+            # Branch, remote and recent commits are independent; query them concurrently
+            with ThreadPoolExecutor(max_workers=3) as executor:
+                branch = executor.submit(self._run_git, "branch", "--show-current")
+                remote = executor.submit(self._run_git, "remote", "get-url", "origin")
+                commits = executor.submit(self._run_git, "log", "--oneline", "-n", "5")
                 
-                # Get recent commits
-                result = subprocess.run(
-                    ["git", "log", "--oneline", "-n", "5"],
-                    cwd=self.workspace_path,
-                    capture_output=True,
-                    text=True,
-                    timeout=5
-                )
-                if result.returncode == 0:
-                    git_info["recent_commits"] = result.stdout.strip().split('\n')
+                if branch.result() is not None:
+                    git_info["branch"] = branch.result()
+                if remote.result() is not None:
+                    git_info["remote"] = remote.result()
+                if commits.result() is not None:
+                    git_info["recent_commits"] = commits.result().split('\n')
         
         except (subprocess.TimeoutExpired, subprocess.SubprocessError, FileNotFoundError):
             pass
         
         return git_info
     
+    def _run_git(self, *args: str) -> Optional[str]:
+        """Run a git command in the workspace.
+        
+        Args:
+            args: Arguments to pass to git
+            
+        Returns:
+            Stripped standard output, or None if the command failed
+        """
+        result = subprocess.run(
+            [_git_executable(), *args],
+            cwd=self.workspace_path,
+            capture_output=True,
+            text=True,
+            timeout=5
+        )
+        if result.returncode != 0:
+            return None
+        return result.stdout.strip()
+    
     def _get_project_info(self) -> Dict[str, Any]:
         """Get project-specific information.
         
@@ -317,28 +377,36 @@ class WorkspaceContextManager:
             "Makefile", "composer.json", "Gemfile"
         ]
         
+        # One directory read tells which markers exist instead of probing each
+        try:
+            present = set(os.listdir(self.workspace_path))
+        except OSError:
+            return project_info
+        
         for file_name in project_files:
+            if file_name not in present:
+                continue
+            
             file_path = self.workspace_path / file_name
-            if file_path.exists():
-                try:
-                    with open(file_path, 'r', encoding='utf-8') as f:
-                        content = f.read()
-                    project_info["files"][file_name] = content[:1000]  # Limit size
-                    
-                    # Detect project type
-                    if file_name == "package.json":
-                        project_info["type"] = "nodejs"
-                    elif file_name in ["requirements.txt", "Pipfile", "pyproject.toml"]:
-                        project_info["type"] = "python"
-                    elif file_name == "Cargo.toml":
-                        project_info["type"] = "rust"
-                    elif file_name == "go.mod":
-                        project_info["type"] = "go"
-                    elif file_name in ["pom.xml", "build.gradle"]:
-                        project_info["type"] = "java"
-                        
-                except (IOError, UnicodeDecodeError):
-                    continue
+            try:
+                # Only the first 1000 characters are kept, so don't read further
+                with open(file_path, 'r', encoding='utf-8') as f:
+                    project_info["files"][file_name] = f.read(1000)
+            except (IOError, UnicodeDecodeError):
+                # Unreadable or not text
+                continue
+            
+            # Detect project type
+            if file_name == "package.json":
+                project_info["type"] = "nodejs"
+            elif file_name in ["requirements.txt", "Pipfile", "pyproject.toml"]:
+                project_info["type"] = "python"
+            elif file_name == "Cargo.toml":
+                project_info["type"] = "rust"
+            elif file_name == "go.mod":
+                project_info["type"] = "go"
+            elif file_name in ["pom.xml", "build.gradle"]:
+                project_info["type"] = "java"
         
         return project_info
     
@@ -354,8 +422,7 @@ class WorkspaceContextManager:
         stats = {}
         
         for file_info in files:
-            path = Path(file_info["path"])
-            extension = path.suffix.lower() or "no_extension"
+            extension = os.path.splitext(file_info["path"])[1].lower() or "no_extension"
             stats[extension] = stats.get(extension, 0) + 1
         
         return stats
\ No newline at end of file
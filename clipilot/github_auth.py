@@ -3,12 +3,21 @@ GitHub OAuth authentication for CLI Pilot.
 Handles device flow authentication to get GitHub tokens.
 """
 
-import json
 import time
 import webbrowser
 from typing import Optional, Dict, Any
 import requests
-from urllib.parse import urlencode
+
+# Shared across calls so device-flow polling and token checks reuse connections
+_session: Optional[requests.Session] = None
+
+
+def _get_session() -> requests.Session:
+    """Return the shared HTTP session, creating it on first use."""
+    global _session
+    if _session is None:
+        _session = requests.Session()
+    return _session
 
 
 class GitHubAuth:
@@ -81,7 +90,7 @@ class GitHubAuth:
             "User-Agent": "CLI-Pilot/1.0"
         }
         
-        response = requests.post(
+        response = _get_session().post(
             self.DEVICE_CODE_URL,
             data=data,
             headers=headers,
@@ -151,7 +160,7 @@ class GitHubAuth:
             if self.verbose:
                 print("Polling for token...")
             
-            response = requests.post(
+            response = _get_session().post(
                 self.ACCESS_TOKEN_URL,
                 data=data,
                 headers=headers,
@@ -199,7 +208,7 @@ class GitHubAuth:
         }
         
         try:
-            response = requests.get(self.USER_URL, headers=headers, timeout=30)
+            response = _get_session().get(self.USER_URL, headers=headers, timeout=30)
             return response.status_code == 200
         except Exception as e:
             if self.verbose:
@@ -221,7 +230,7 @@ class GitHubAuth:
         }
         
         try:
-            response = requests.get(self.USER_URL, headers=headers, timeout=30)
+            response = _get_session().get(self.USER_URL, headers=headers, timeout=30)
             if response.status_code == 200:
                 return response.json()
             else:
@@ -2,13 +2,39 @@
 Interactive session for CLI Pilot.
 """
 
-import os
-import sys
-from typing import Optional, Dict, Any
+from typing import Optional
 from .chat_interface import ChatInterface
 from .context_manager import WorkspaceContextManager
 
 
+# Output of /help; built once and written with a single print
+_HELP_TEXT = """
+📖 CLI Pilot Help
+========================================
+Commands:
+  /help     - Show this help message
+  /context  - Show workspace context information
+  /files    - List relevant files in workspace
+  /history  - Show chat history
+  /clear    - Clear chat history
+  /exit     - Exit interactive session
+
+Chat Examples:
+  • Explain this code
+  • Create a Python function that validates emails
+  • Fix the bug in my authentication logic
+  • Write tests for the User class
+  • Refactor this function to be more efficient
+  • How do I implement error handling?
+
+Tips:
+  • Be specific about what you want to achieve
+  • Mention specific files, functions, or concepts
+  • Ask follow-up questions for clarification
+========================================
+"""
+
+
 class InteractiveSession:
     """Interactive chat session for CLI Pilot."""
     
@@ -70,26 +96,28 @@ class InteractiveSession:
     def _print_welcome(self):
         """Print welcome message."""
         workspace_path = self.context_manager.workspace_path
+        agent_line = f"Agent: {self.agent}\n" if self.agent else ""
         
-        print("=" * 60)
-        print("🚀 CLI Pilot - Interactive Chat Session")
-        print("=" * 60)
-        print(f"Workspace: {workspace_path}")
-        if self.agent:
-            print(f"Agent: {self.agent}")
-        print()
-        print("Commands:")
-        print("  /help     - Show help")
-        print("  /context  - Show workspace context")
-        print("  /files    - List workspace files")
-        print("  /history  - Show chat history")
-        print("  /clear    - Clear chat history")
-        print("  /exit     - Exit session")
-        print()
-        print("Type your message and press Enter to chat with Copilot.")
-        print("Press Ctrl+C or type '/exit' to quit.")
-        print("=" * 60)
-        print()
+        # Written as one block rather than a print per line
+        print(
+            f"{'=' * 60}\n"
+            "🚀 CLI Pilot - Interactive Chat Session\n"
+            f"{'=' * 60}\n"
+            f"Workspace: {workspace_path}\n"
+            f"{agent_line}"
+            "\n"
+            "Commands:\n"
+            "  /help     - Show help\n"
+            "  /context  - Show workspace context\n"
+            "  /files    - List workspace files\n"
+            "  /history  - Show chat history\n"
+            "  /clear    - Clear chat history\n"
+            "  /exit     - Exit session\n"
+            "\n"
+            "Type your message and press Enter to chat with Copilot.\n"
+            "Press Ctrl+C or type '/exit' to quit.\n"
+            f"{'=' * 60}\n"
+        )
     
     def _get_user_input(self) -> str:
         """Get user input with a prompt.
@@ -112,34 +140,12 @@ class InteractiveSession:
         Returns:
             True if command was handled, False otherwise
         """
-        command = user_input.strip().lower()
-        
-        if command == "/help":
-            self._show_help()
-            return True
-        
-        elif command == "/context":
-            self._show_context()
-            return True
-        
-        elif command == "/files":
-            self._show_files()
-            return True
-        
-        elif command == "/history":
-            self._show_history()
-            return True
+        handler = self._SLASH_COMMANDS.get(user_input.strip().lower())
+        if handler is None:
+            return False
         
-        elif command == "/clear":
-            self._clear_history()
-            return True
-        
-        elif command in ["/exit", "/quit", "/q"]:
-            self.session_active = False
-            print("Goodbye! 👋")
-            return True
-        
-        return False
+        handler(self)
+        return True
     
     def _process_message(self, message: str):
         """Process a chat message.
@@ -187,30 +193,7 @@ class InteractiveSession:
     
     def _show_help(self):
         """Show help information."""
-        print("\n📖 CLI Pilot Help")
-        print("=" * 40)
-        print("Commands:")
-        print("  /help     - Show this help message")
-        print("  /context  - Show workspace context information")
-        print("  /files    - List relevant files in workspace")
-        print("  /history  - Show chat history")
-        print("  /clear    - Clear chat history")
-        print("  /exit     - Exit interactive session")
-        print()
-        print("Chat Examples:")
-        print("  • Explain this code")
-        print("  • Create a Python function that validates emails")
-        print("  • Fix the bug in my authentication logic")
-        print("  • Write tests for the User class")
-        print("  • Refactor this function to be more efficient")
-        print("  • How do I implement error handling?")
-        print()
-        print("Tips:")
-        print("  • Be specific about what you want to achieve")
-        print("  • Mention specific files, functions, or concepts")
-        print("  • Ask follow-up questions for clarification")
-        print("=" * 40)
-        print()
+        print(_HELP_TEXT)
     
     def _show_context(self):
         """Show workspace context information."""
@@ -254,33 +237,35 @@ class InteractiveSession:
     
     def _show_files(self):
         """Show relevant files in workspace."""
-        print("\n📄 Workspace Files")
-        print("=" * 40)
+        # Header goes out first so something shows while the workspace is scanned
+        print("\n📄 Workspace Files\n" + "=" * 40)
         
+        lines = []
         try:
             context = self.context_manager.get_workspace_context()
             files = context.get("files", [])
             
             if not files:
-                print("No relevant files found.")
+                lines.append("No relevant files found.")
             else:
-                print(f"Showing {len(files)} files:")
+                lines.append(f"Showing {len(files)} files:")
                 for i, file_info in enumerate(files[:20], 1):  # Limit to 20 files
                     path = file_info.get("path", "Unknown")
                     size = file_info.get("size", 0)
                     language = file_info.get("language", "unknown")
                     
                     size_str = self._format_file_size(size)
-                    print(f"  {i:2d}. {path} ({language}, {size_str})")
+                    lines.append(f"  {i:2d}. {path} ({language}, {size_str})")
                 
                 if len(files) > 20:
-                    print(f"  ... and {len(files) - 20} more files")
+                    lines.append(f"  ... and {len(files) - 20} more files")
         
         except Exception as e:
-            print(f"❌ Error listing files: {e}")
+            lines.append(f"❌ Error listing files: {e}")
         
-        print("=" * 40)
-        print()
+        lines.append("=" * 40)
+        lines.append("")
+        print("\n".join(lines))
     
     def _show_history(self):
         """Show chat history."""
@@ -317,6 +302,23 @@ class InteractiveSession:
         print("\n✅ Chat history cleared.")
         print()
     
+    def _exit_session(self):
+        """End the session after the current command."""
+        self.session_active = False
+        print("Goodbye! 👋")
+    
+    # Slash command -> handler, shared by all instances
+    _SLASH_COMMANDS = {
+        "/help": _show_help,
+        "/context": _show_context,
+        "/files": _show_files,
+        "/history": _show_history,
+        "/clear": _clear_history,
+        "/exit": _exit_session,
+        "/quit": _exit_session,
+        "/q": _exit_session
+    }
+    
     def _format_file_size(self, size_bytes: int) -> str:
         """Format file size in human-readable format.
         
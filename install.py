@@ -3,32 +3,74 @@
 Installation script for CLI Pilot dependencies.
 """
 
+import compileall
 import subprocess
 import sys
 import os
+import venv
+from collections import deque
 from pathlib import Path
 
 
 def run_command(command, description):
-    """Run a command and handle errors."""
+    """Run a command (given as an argument list) and handle errors."""
     print(f"Running: {description}")
+    # Keep only the tail of the output for the failure summary
+    tail = deque(maxlen=20)
     try:
-        result = subprocess.run(command, shell=True, check=True, capture_output=True, text=True)
-        print(f"✓ {description} completed successfully")
-        if result.stdout.strip():
-            print(f"  Output: {result.stdout.strip()}")
-        return True
-    except subprocess.CalledProcessError as e:
+        # Stream output as it arrives instead of buffering it all until exit
+        with subprocess.Popen(command, stdout=subprocess.PIPE, stderr=subprocess.STDOUT,
+                              text=True, bufsize=1) as process:
+            for line in process.stdout:
+                line = line.rstrip("\n")
+                print(f"  {line}")
+                tail.append(line)
+            returncode = process.wait()
+        
+        if returncode == 0:
+            print(f"✓ {description} completed successfully")
+            return True
+        
+        print(f"✗ {description} failed:")
+        print(f"  Command: {' '.join(command)}")
+        print(f"  Exit code: {returncode}")
+        if tail:
+            print("  Last output:")
+            for line in tail:
+                print(f"    {line}")
+        return False
+    except OSError as e:
+        # Without a shell in between, a missing executable raises here
         print(f"✗ {description} failed:")
-        print(f"  Command: {command}")
-        print(f"  Exit code: {e.returncode}")
-        if e.stdout.strip():
-            print(f"  Output: {e.stdout.strip()}")
-        if e.stderr.strip():
-            print(f"  Error: {e.stderr.strip()}")
+        print(f"  Command: {' '.join(command)}")
+        print(f"  Error: {e}")
+        return False
+
+
+def create_virtualenv(path):
+    """Create the virtual environment in-process with the running interpreter."""
+    print("Running: Creating virtual environment")
+    try:
+        venv.EnvBuilder(with_pip=True, symlinks=(os.name != "nt")).create(str(path))
+        print("✓ Creating virtual environment completed successfully")
+        return True
+    except Exception as e:
+        print("✗ Creating virtual environment failed:")
+        print(f"  Error: {e}")
         return False
 
 
+def precompile_sources():
+    """Byte-compile the clipilot package so the first run doesn't have to."""
+    print("Running: Precompiling CLI Pilot modules")
+    # The venv shares this interpreter, so the cached bytecode matches it
+    if compileall.compile_dir("clipilot", quiet=1):
+        print("✓ Precompiling CLI Pilot modules completed successfully")
+        return True
+    print("✗ Precompiling CLI Pilot modules failed (modules will compile on first run)")
+    return False
+
+
 def create_launch_script():
     """Create a launch script that activates the virtual environment."""
     launch_script = """#!/bin/bash
@@ -72,18 +114,21 @@ def main():
     if venv_path.exists():
         print("Virtual environment already exists")
     else:
-        if not run_command("python3 -m venv venv", "Creating virtual environment"):
+        if not create_virtualenv(venv_path):
             print("\nFailed to create virtual environment.")
             print("Make sure you have python3-venv installed:")
             print("  sudo apt install python3-venv")
             return 1
     
     # Install requirements in virtual environment
-    pip_command = "./venv/bin/pip install -r requirements.txt"
+    pip_command = ["./venv/bin/pip", "install", "-r", "requirements.txt"]
     if not run_command(pip_command, "Installing requirements in virtual environment"):
         print("\nInstallation failed. Please check the error messages above.")
         return 1
     
+    # Not fatal: Python compiles anything missing on import
+    precompile_sources()
+    
     # Create launcher script
     create_launch_script()
     
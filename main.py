@@ -6,21 +6,12 @@ Run GitHub Copilot Chat functionality without VSCode.
 
 import argparse
 import sys
-import os
-from pathlib import Path
+from functools import lru_cache
+from typing import Dict, List, Optional, Tuple
 
-# Add clipilot to Python path
-sys.path.insert(0, str(Path(__file__).parent / "clipilot"))
 
-from clipilot.cli_core import CLIPilot
-
-
-def main():
-    """Main entry point for CLI Pilot."""
-    parser = argparse.ArgumentParser(
-        description="CLI Pilot - Run GitHub Copilot Chat without VSCode",
-        formatter_class=argparse.RawDescriptionHelpFormatter,
-        epilog="""
+# Usage examples, shown only in the top-level help
+_EXAMPLES = """
 Examples:
   python main.py auth login                           # Login with GitHub OAuth
   python main.py auth status                          # Check authentication status
@@ -30,45 +21,150 @@ Examples:
   python main.py interactive
   python main.py setup --token <your-token>          # Manual token setup
   python main.py --help
-        """
+"""
+
+_VERSION = "CLI Pilot 1.0.0"
+
+# Global options that take a value, so their argument is not mistaken for a command
+_GLOBAL_VALUE_OPTIONS = ("--config", "--workspace")
+
+
+def _sniff_subcommand(argv: List[str]) -> Optional[str]:
+    """Find the subcommand in argv without building the full parser.
+    
+    Args:
+        argv: Command line arguments, excluding the program name
+        
+    Returns:
+        The first token that is not a global option or its value (a subcommand,
+        or a flag such as --help or --version), or None if there is none
+    """
+    args = iter(argv)
+    for arg in args:
+        if arg in _GLOBAL_VALUE_OPTIONS:
+            next(args, None)
+        elif arg in ("--verbose", "-v") or arg.startswith(("--config=", "--workspace=")):
+            continue
+        else:
+            return arg
+    return None
+
+
+# Subcommand schema: name -> (help, ((flags, options), ...), nested)
+# where nested is None or (dest, help, {name: schema}) for a further level
+_SUBCOMMANDS = {
+    "auth": ("GitHub authentication management", (), (
+        "auth_command", "Authentication commands", {
+            "login": ("Login with GitHub OAuth", (
+                (("--client-id",), {"help": "Custom GitHub OAuth client ID"}),
+            ), None),
+            "status": ("Check authentication status", (), None),
+            "logout": ("Remove stored authentication", (), None),
+        },
+    )),
+    "chat": ("Send a chat message to Copilot", (
+        (("message",), {"help": "The message to send to Copilot"}),
+        (("--file", "-f"), {"help": "File to include as context", "action": "append"}),
+        (("--context", "-c"), {"action": "store_true", "help": "Include workspace context"}),
+        (("--agent",), {"help": "Specific agent to use (workspace, vscode, etc.)"}),
+    ), None),
+    "interactive": ("Start interactive chat session", (
+        (("--agent",), {"help": "Specific agent to use"}),
+    ), None),
+    "setup": ("Setup CLI Pilot configuration manually", (
+        (("--token",), {"help": "GitHub Copilot token"}),
+    ), None),
+}
+
+
+def _add_subcommand(subparsers, name: str, schema: Tuple) -> argparse.ArgumentParser:
+    """Realize one subcommand from its schema entry.
+    
+    Args:
+        subparsers: Subparsers action to add the command to
+        name: Subcommand name
+        schema: (help, arguments, nested) entry from _SUBCOMMANDS
+        
+    Returns:
+        The parser for the subcommand
+    """
+    help_text, arguments, nested = schema
+    subparser = subparsers.add_parser(name, help=help_text)
+    for flags, options in arguments:
+        subparser.add_argument(*flags, **options)
+    if nested is not None:
+        dest, nested_help, children = nested
+        nested_subparsers = subparser.add_subparsers(dest=dest, help=nested_help)
+        for child_name, child_schema in children.items():
+            _add_subcommand(nested_subparsers, child_name, child_schema)
+    return subparser
+
+
+@lru_cache(maxsize=8)
+def _build_parser(command: Optional[str] = None) -> Tuple[argparse.ArgumentParser, Dict[str, argparse.ArgumentParser]]:
+    """Build the command line parser.
+    
+    Args:
+        command: Subcommand to build; all of them are built when it is unknown or None
+        
+    Returns:
+        Tuple of the top-level parser and the subcommand parsers by name;
+        cached per command, so callers must not modify them
+    """
+    # The examples only appear in top-level help, which a subcommand run never prints
+    epilog = None if command in _SUBCOMMANDS else _EXAMPLES
+    parser = argparse.ArgumentParser(
+        description="CLI Pilot - Run GitHub Copilot Chat without VSCode",
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog=epilog
     )
     
-    parser.add_argument("--version", action="version", version="CLI Pilot 1.0.0")
+    parser.add_argument("--version", action="version", version=_VERSION)
     parser.add_argument("--config", help="Path to configuration file")
     parser.add_argument("--workspace", help="Workspace directory (default: current directory)", default=".")
     parser.add_argument("--verbose", "-v", action="store_true", help="Enable verbose output")
     
     subparsers = parser.add_subparsers(dest="command", help="Available commands")
     
-    # Authentication command
-    auth_parser = subparsers.add_parser("auth", help="GitHub authentication management")
-    auth_subparsers = auth_parser.add_subparsers(dest="auth_command", help="Authentication commands")
-    
-    # Auth login command
-    login_parser = auth_subparsers.add_parser("login", help="Login with GitHub OAuth")
-    login_parser.add_argument("--client-id", help="Custom GitHub OAuth client ID")
-    
-    # Auth status command
-    status_parser = auth_subparsers.add_parser("status", help="Check authentication status")
-    
-    # Auth logout command
-    logout_parser = auth_subparsers.add_parser("logout", help="Remove stored authentication")
-    
-    # Chat command
-    chat_parser = subparsers.add_parser("chat", help="Send a chat message to Copilot")
-    chat_parser.add_argument("message", help="The message to send to Copilot")
-    chat_parser.add_argument("--file", "-f", help="File to include as context", action="append")
-    chat_parser.add_argument("--context", "-c", action="store_true", help="Include workspace context")
-    chat_parser.add_argument("--agent", help="Specific agent to use (workspace, vscode, etc.)")
-    
-    # Interactive command
-    interactive_parser = subparsers.add_parser("interactive", help="Start interactive chat session")
-    interactive_parser.add_argument("--agent", help="Specific agent to use")
+    # Only the requested subcommand is needed to parse a real invocation;
+    # help and error output list every command, so build them all otherwise
+    if command in _SUBCOMMANDS:
+        names = (command,)
+    else:
+        names = _SUBCOMMANDS
+    subcommand_parsers = {name: _add_subcommand(subparsers, name, _SUBCOMMANDS[name]) for name in names}
     
-    # Setup command (for manual token setup)
-    setup_parser = subparsers.add_parser("setup", help="Setup CLI Pilot configuration manually")
-    setup_parser.add_argument("--token", help="GitHub Copilot token")
+    return parser, subcommand_parsers
+
+
+# Command handlers, called as handler(clipilot, args)
+_AUTH_HANDLERS = {
+    "login": lambda clipilot, args: clipilot.handle_auth_login(client_id=args.client_id),
+    "status": lambda clipilot, args: clipilot.handle_auth_status(),
+    "logout": lambda clipilot, args: clipilot.handle_auth_logout(),
+}
+
+_COMMAND_HANDLERS = {
+    "chat": lambda clipilot, args: clipilot.handle_chat(
+        message=args.message,
+        files=args.file or [],
+        include_context=args.context,
+        agent=args.agent
+    ),
+    "interactive": lambda clipilot, args: clipilot.start_interactive(agent=args.agent),
+    "setup": lambda clipilot, args: clipilot.setup(token=args.token),
+}
+
+
+def main():
+    """Main entry point for CLI Pilot."""
+    command = _sniff_subcommand(sys.argv[1:])
+    if command == "--version":
+        # Same output as argparse's version action, without building a parser
+        print(_VERSION)
+        return 0
     
+    parser, subcommand_parsers = _build_parser(command)
     args = parser.parse_args()
     
     if not args.command:
@@ -76,6 +172,9 @@ Examples:
         return 1
     
     try:
+        # Imported only once a command is known; --help/--version never need it
+        from clipilot.cli_core import CLIPilot
+        
         clipilot = CLIPilot(
             workspace=args.workspace,
             verbose=args.verbose,
@@ -83,31 +182,17 @@ Examples:
         )
         
         if args.command == "auth":
-            if not args.auth_command:
-                auth_parser.print_help()
+            handler = _AUTH_HANDLERS.get(args.auth_command)
+            if handler is None:
+                subcommand_parsers["auth"].print_help()
                 return 1
-            
-            if args.auth_command == "login":
-                return clipilot.handle_auth_login(client_id=getattr(args, 'client_id', None))
-            elif args.auth_command == "status":
-                return clipilot.handle_auth_status()
-            elif args.auth_command == "logout":
-                return clipilot.handle_auth_logout()
+            return handler(clipilot, args)
         
-        elif args.command == "chat":
-            return clipilot.handle_chat(
-                message=args.message,
-                files=args.file or [],
-                include_context=args.context,
-                agent=args.agent
-            )
-        elif args.command == "interactive":
-            return clipilot.start_interactive(agent=args.agent)
-        elif args.command == "setup":
-            return clipilot.setup(token=args.token)
-        else:
+        handler = _COMMAND_HANDLERS.get(args.command)
+        if handler is None:
             parser.print_help()
             return 1
+        return handler(clipilot, args)
             
     except KeyboardInterrupt:
         print("\nOperation cancelled by user.")
@@ -117,7 +202,7 @@ Examples:
             import traceback
             traceback.print_exc()
         else:
-            print(f"Error: {e}")
+            print(f"Error: {e}", file=sys.stderr)
         return 1
 
 